@@ -2,20 +2,46 @@
 
 from __future__ import annotations
 
-import warnings
 from typing import Any, Callable, Literal
 
 from gradio_client.documentation import document, set_documentation_group
 from gradio_client.serializing import StringSerializable
 
 from gradio.components.base import FormComponent, IOComponent, _Keywords
-from gradio.deprecation import warn_deprecation, warn_style_method_deprecation
+from gradio.deprecation import (
+    warn_deprecation,
+    warn_deprecation_once,
+    warn_style_method_deprecation,
+)
 from gradio.events import Changeable, EventListenerMethod, Inputable, Selectable
 from gradio.interpretation import NeighborInterpretable
 
 set_documentation_group("component")
 
 
+def _normalize_choices(
+    choices: list[str | int | float | tuple[str, str | int | float]] | None,
+) -> tuple[list[tuple[str, str | int | float]], dict[str | int | float, int]]:
+    """
+    Normalizes a list of choices into (name, value) tuples, building the
+    value-to-index lookup in the same pass so the list is only iterated once.
+    """
+    normalized: list[tuple[str, str | int | float]] = []
+    value_to_index: dict[str | int | float, int] = {}
+    append = normalized.append
+    _str = str
+    for index, choice in enumerate(choices or ()):
+        # Exact-class checks instead of isinstance: choices are plain tuples, or
+        # plain lists if the Gradio app is loaded with gr.load() since Python
+        # tuples are converted to lists in JSON.
+        cls = choice.__class__
+        if cls is not tuple:
+            choice = tuple(choice) if cls is list else (_str(choice), choice)
+        append(choice)
+        value_to_index[choice[1]] = index
+    return normalized, value_to_index
+
+
 @document()
 class Radio(
     FormComponent,
@@ -71,19 +97,14 @@ class Radio(
             elem_id: An optional string that is assigned as the id of this component in the HTML DOM. Can be used for targeting CSS styles.
             elem_classes: An optional list of strings that are assigned as the classes of this component in the HTML DOM. Can be used for targeting CSS styles.
         """
-        self.choices = (
-            # Although we expect choices to be a list of tuples, it can be a list of tuples if the Gradio app
-            # is loaded with gr.load() since Python tuples are converted to lists in JSON.
-            [tuple(c) if isinstance(c, (tuple, list)) else (str(c), c) for c in choices]
-            if choices
-            else []
-        )
+        self.choices, self._value_to_index = _normalize_choices(choices)
         valid_types = ["value", "index"]
         if type not in valid_types:
             raise ValueError(
                 f"Invalid value for parameter `type`: {type}. Please choose from one of: {valid_types}"
             )
         self.type = type
+        self._type_is_index = type == "index"
         self.select: EventListenerMethod
         """
         Event listener for when the user selects Radio option.
@@ -131,14 +152,10 @@ class Radio(
         interactive: bool | None = None,
         visible: bool | None = None,
     ):
-        warnings.warn(
+        warn_deprecation_once(
             "Using the update method is deprecated. Simply return a new object instead, e.g. `return gr.Radio(...)` instead of `return gr.Radio.update(...)`."
         )
-        choices = (
-            None
-            if choices is None
-            else [c if isinstance(c, tuple) else (str(c), c) for c in choices]
-        )
+        choices = None if choices is None else _normalize_choices(choices)[0]
         return {
             "choices": choices,
             "label": label,
@@ -160,18 +177,9 @@ class Radio(
         Returns:
             value of the selected choice as string or index within choice list
         """
-        if self.type == "value":
-            return x
-        elif self.type == "index":
-            if x is None:
-                return None
-            else:
-                choice_values = [value for _, value in self.choices]
-                return choice_values.index(x) if x in choice_values else None
-        else:
-            raise ValueError(
-                f"Unknown type: {self.type}. Please choose from: 'value', 'index'."
-            )
+        if self._type_is_index:
+            return None if x is None else self._value_to_index.get(x)
+        return x
 
     def get_interpretation_neighbors(self, x):
         choices = [value for _, value in self.choices]
@@ -185,8 +193,7 @@ class Radio(
         Returns:
             Each value represents the interpretation score corresponding to each choice.
         """
-        choices = [value for _, value in self.choices]
-        scores.insert(choices.index(x), None)
+        scores.insert(self._value_to_index[x], None)
         return scores
 
     def style(
@@ -207,4 +214,5 @@ class Radio(
         return self
 
     def as_example(self, input_data):
-        return next((c[0] for c in self.choices if c[1] == input_data), None)
+        index = self._value_to_index.get(input_data)
+        return None if index is None else self.choices[index][0]
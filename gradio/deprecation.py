@@ -74,6 +74,21 @@ def warn_deprecation(text: str) -> None:
     )
 
 
+_warned_once: set[str] = set()
+
+
+def warn_deprecation_once(text: str) -> None:
+    """
+    Like warn_deprecation, but emits each distinct message at most once per
+    process. Intended for deprecation notices on frequently-called code paths,
+    where repeating the message adds warnings-machinery overhead without
+    telling the user anything new.
+    """
+    if text not in _warned_once:
+        _warned_once.add(text)
+        warn_deprecation(text)
+
+
 def warn_style_method_deprecation() -> None:
     warn_deprecation(
         "The `style` method is deprecated. Please set these arguments in the constructor instead."
@@ -3,14 +3,15 @@ of the on-page-load event, which is defined in gr.Blocks().load()."""
 
 from __future__ import annotations
 
-from functools import wraps
+import sys
+from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Literal, Sequence
 
 from gradio_client.documentation import document, set_documentation_group
 
 from gradio.blocks import Block
 from gradio.context import Context
-from gradio.deprecation import warn_deprecation
+from gradio.deprecation import warn_deprecation_once
 from gradio.helpers import EventData
 from gradio.utils import get_cancel_function
 
@@ -19,6 +20,8 @@ if TYPE_CHECKING:  # Only import for type checking (is False at runtime).
 
 set_documentation_group("events")
 
+_STOP = sys.intern("stop")
+
 
 def set_cancel_events(
     triggers: Sequence[EventListenerMethod],
@@ -52,33 +55,108 @@ class EventListener(Block):
                 event_listener_class.__init__(self)
 
 
-class Dependency(dict):
-    def __init__(self, key_vals, dep_index, fn):
-        super().__init__(key_vals)
-        self.fn = fn
-        self.then = EventListenerMethod(
+_chain_listeners: dict[tuple[int | None, bool], EventListenerMethod] = {}
+
+
+def _chain_listener(
+    dep_index: int | None, trigger_only_on_success: bool
+) -> EventListenerMethod:
+    """Returns a memoized "then"/"success" listener for the given dependency index.
+
+    These listeners are immutable once constructed, so every Dependency with the
+    same (dep_index, trigger_only_on_success) pair can share a single instance
+    instead of allocating a fresh one per event registration.
+    """
+    key = (dep_index, trigger_only_on_success)
+    listener = _chain_listeners.get(key)
+    if listener is None:
+        listener = _chain_listeners[key] = EventListenerMethod(
             None,
-            "then",
+            "success" if trigger_only_on_success else "then",
             trigger_after=dep_index,
-            trigger_only_on_success=False,
+            trigger_only_on_success=trigger_only_on_success,
         )
+    return listener
+
+
+class Dependency:
+    """
+    The handle returned when an event listener is registered (e.g. by `btn.click(...)`).
+    Behaves as a read-only mapping over the dependency's config dict; call `dict(dep)`
+    to get a plain dict. Using __slots__ (rather than subclassing dict and carrying an
+    instance __dict__ as well) keeps the per-event-registration footprint to a single
+    reference to the config dict that Blocks already stores.
+    """
+
+    __slots__ = ("fn", "then", "success", "_d")
+
+    def __init__(self, key_vals, dep_index, fn):
+        self._d = key_vals
+        self.fn = fn
+        self.then = _chain_listener(dep_index, False)
         """
         Triggered after directly preceding event is completed, regardless of success or failure.
         """
-        self.success = EventListenerMethod(
-            None,
-            "success",
-            trigger_after=dep_index,
-            trigger_only_on_success=True,
-        )
+        self.success = _chain_listener(dep_index, True)
         """
         Triggered after directly preceding event is completed, if it was successful.
         """
 
+    def __getitem__(self, key):
+        return self._d[key]
+
+    def __contains__(self, key):
+        return key in self._d
+
+    def __iter__(self):
+        return iter(self._d)
+
+    def __len__(self):
+        return len(self._d)
+
+    def __eq__(self, other):
+        if isinstance(other, Dependency):
+            other = other._d
+        return self._d == other
+
+    def get(self, key, default=None):
+        return self._d.get(key, default)
+
+    def keys(self):
+        return self._d.keys()
+
+    def values(self):
+        return self._d.values()
+
+    def items(self):
+        return self._d.items()
+
+    def __repr__(self):
+        return repr(self._d)
+
     def __call__(self, *args, **kwargs):
         return self.fn(*args, **kwargs)
 
 
+class _DecoratorRegistrar:
+    """
+    Returned when an event listener is called in decorator mode (without a fn).
+    Calling it registers the decorated function and hands the function back
+    unchanged, without building the Dependency (and its then/success listeners)
+    that a direct registration returns, since a decorator handle has no use for
+    them.
+    """
+
+    __slots__ = ("_register",)
+
+    def __init__(self, register):
+        self._register = register
+
+    def __call__(self, func):
+        self._register(func)
+        return func
+
+
 class EventListenerMethod:
     """
     Triggered on an event deployment.
@@ -94,7 +172,9 @@ class EventListenerMethod:
         trigger_only_on_success: bool = False,
     ):
         self.trigger = trigger
-        self.event_name = event_name
+        # Interned so that event-name comparisons and dict lookups keyed on the
+        # name resolve by identity rather than a full string compare.
+        self.event_name = sys.intern(event_name)
         self.show_progress = show_progress
         self.callback = callback
         self.trigger_after = trigger_after
@@ -117,7 +197,7 @@ class EventListenerMethod:
         cancels: dict[str, Any] | list[dict[str, Any]] | None = None,
         every: float | None = None,
         _js: str | None = None,
-    ) -> Dependency:
+    ) -> Dependency | _DecoratorRegistrar:
         """
         Parameters:
             fn: the function to call when this event is triggered. Often a machine learning model's prediction function. Each parameter of the function corresponds to one input component, and the function should return a single value or a tuple of values, with each element in the tuple corresponding to one output component.
@@ -136,40 +216,32 @@ class EventListenerMethod:
             every: Run this event 'every' number of seconds while the client connection is open. Interpreted in seconds. Queue must be enabled.
         """
         if fn == "decorator":
-
-            def wrapper(func):
-                self.__call__(
-                    func,
-                    inputs,
-                    outputs,
-                    api_name,
-                    status_tracker,
-                    scroll_to_output,
-                    show_progress,
-                    queue,
-                    batch,
-                    max_batch_size,
-                    preprocess,
-                    postprocess,
-                    cancels,
-                    every,
-                    _js,
+            return _DecoratorRegistrar(
+                partial(
+                    self.__call__,
+                    inputs=inputs,
+                    outputs=outputs,
+                    api_name=api_name,
+                    status_tracker=status_tracker,
+                    scroll_to_output=scroll_to_output,
+                    show_progress=show_progress,
+                    queue=queue,
+                    batch=batch,
+                    max_batch_size=max_batch_size,
+                    preprocess=preprocess,
+                    postprocess=postprocess,
+                    cancels=cancels,
+                    every=every,
+                    _js=_js,
                 )
-
-                @wraps(func)
-                def inner(*args, **kwargs):
-                    return func(*args, **kwargs)
-
-                return inner
-
-            return Dependency({}, None, wrapper)
+            )
 
         if status_tracker:
-            warn_deprecation(
+            warn_deprecation_once(
                 "The 'status_tracker' parameter has been deprecated and has no effect."
             )
-        if self.event_name == "stop":
-            warn_deprecation(
+        if self.event_name is _STOP:
+            warn_deprecation_once(
                 "The `stop` event on Video and Audio has been deprecated and will be remove in a future version. Use `ended` instead."
             )
 
@@ -226,7 +298,7 @@ def on(
     cancels: dict[str, Any] | list[dict[str, Any]] | None = None,
     every: float | None = None,
     _js: str | None = None,
-) -> Dependency:
+) -> Dependency | _DecoratorRegistrar:
     """
     Parameters:
         triggers: List of triggers to listen to, e.g. [btn.click, number.change]. If None, will listen to changes to any inputs.
@@ -252,11 +324,10 @@ def on(
         inputs = [inputs]
 
     if fn == "decorator":
-
-        def wrapper(func):
-            on(
+        return _DecoratorRegistrar(
+            partial(
+                on,
                 triggers,
-                fn=func,
                 inputs=inputs,
                 outputs=outputs,
                 api_name=api_name,
@@ -271,14 +342,7 @@ def on(
                 every=every,
                 _js=_js,
             )
-
-            @wraps(func)
-            def inner(*args, **kwargs):
-                return func(*args, **kwargs)
-
-            return inner
-
-        return Dependency({}, None, wrapper)
+        )
 
     if Context.root_block is None:
         raise Exception("Cannot call on() outside of a gradio.Blocks context.")
@@ -479,6 +543,8 @@ class Selectable(EventListener):
 
 
 class SelectData(EventData):
+    __slots__ = ("index", "value", "selected")
+
     def __init__(self, target: Block | None, data: Any):
         super().__init__(target, data)
         self.index: int | tuple[int, int] = data["index"]
@@ -489,7 +555,7 @@ class SelectData(EventData):
         """
         The value of the selected item.
         """
-        self.selected: bool = data.get("selected", True)
+        self.selected: bool = data["selected"] if "selected" in data else True
         """
         True if the item was selected, False if deselected.
         """
@@ -515,6 +581,8 @@ class Likeable(EventListener):
 
 
 class LikeData(EventData):
+    __slots__ = ("index", "value", "liked")
+
     def __init__(self, target: Block | None, data: Any):
         super().__init__(target, data)
         self.index: int | tuple[int, int] = data["index"]
@@ -525,7 +593,7 @@ class LikeData(EventData):
         """
         The value of the liked/disliked item.
         """
-        self.liked: bool = data.get("liked", True)
+        self.liked: bool = data["liked"] if "liked" in data else True
         """
         True if the item was liked, False if disliked.
         """
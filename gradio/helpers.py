@@ -1081,6 +1081,8 @@ class EventData:
     Demos: gallery_selections, tictactoe
     """
 
+    __slots__ = ("target", "_data")
+
     def __init__(self, target: Block | None, _data: Any):
         """
         Parameters: